@@ -2,11 +2,18 @@
 
 import logging
 import os
+import pickle
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 logger = logging.getLogger(__name__)
 
 # Default: look for config relative to repo root
@@ -17,9 +24,127 @@ PATTERNS_DIR = Path(
     os.environ.get("PATTERNS_DIR", str(REPO_ROOT / "config" / "patterns"))
 )
 
+# Prebuilt bundle of every parsed pattern (see write_bundle), kept alongside
+# the YAML sources. Pickle rather than JSON: pattern YAML uses integer keys
+# (tier_defaults), which a JSON round trip would turn into strings.
+BUNDLE_FILE = "patterns.pkl"
+
+# Unpickling runs code, so the bundle is only read from PATTERNS_DIR when the
+# image build that wrote it opts in (set next to write_bundle in Dockerfile)
+USE_BUNDLE = os.environ.get("PATTERNS_BUNDLE", "").lower() in ("1", "true", "yes")
+
 # Module-level cache
 _patterns_cache: dict[str, dict[str, Any]] | None = None
 
+# Parsed files keyed by path -> (mtime_ns, size, parsed YAML), LRU-bounded.
+# Survives clear_cache(); entries are revalidated with os.stat on every use.
+_FILE_CACHE_MAX = 100
+_file_cache: OrderedDict[str, tuple[int, int, Any]] = OrderedDict()
+
+
+def _load_pattern_file(path: Path) -> Any:
+    """Parse a pattern YAML file, skipping the parse if it is unchanged.
+
+    Parsed patterns are treated as read-only, so cached objects are shared
+    rather than copied.
+    """
+    st = path.stat()
+    key = str(path)
+    cached = _file_cache.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        _file_cache.move_to_end(key)
+        return cached[2]
+
+    # Hand raw bytes to the (C) loader; it detects the encoding itself
+    data = yaml.load(path.read_bytes(), Loader=_SafeLoader)
+    _file_cache[key] = (st.st_mtime_ns, st.st_size, data)
+    _file_cache.move_to_end(key)
+    if len(_file_cache) > _FILE_CACHE_MAX:
+        _file_cache.popitem(last=False)
+    return data
+
+
+def _list_pattern_files(directory: Path) -> list[Path]:
+    """List pattern YAML files in a directory, sorted by file name."""
+    # Plain suffix match over one scandir pass (no fnmatch/glob machinery);
+    # sorting by name keeps the load order deterministic across filesystems
+    return sorted(
+        (
+            Path(entry.path)
+            for entry in os.scandir(directory)
+            if entry.name.endswith(".yaml") and entry.is_file()
+        ),
+        key=lambda p: p.name,
+    )
+
+
+def _parse_patterns(pattern_files: list[Path]) -> dict[str, dict[str, Any]]:
+    """Parse pattern YAML files into a name -> definition mapping."""
+    patterns: dict[str, dict[str, Any]] = {}
+    for pattern_file in pattern_files:
+        pattern = _load_pattern_file(pattern_file)
+        if pattern and "name" in pattern:
+            patterns[pattern["name"]] = pattern
+            logger.debug("Loaded pattern: %s", pattern["name"])
+    return patterns
+
+
+def _read_bundle(
+    directory: Path, pattern_files: list[Path]
+) -> dict[str, dict[str, Any]] | None:
+    """Load the prebuilt bundle if it is current for pattern_files.
+
+    The bundle is used only if it was built from exactly these file names and
+    is not older than any of them; otherwise the YAML is parsed as usual.
+    """
+    bundle_file = directory / BUNDLE_FILE
+    try:
+        bundle_mtime = bundle_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    if any(p.stat().st_mtime_ns > bundle_mtime for p in pattern_files):
+        logger.info("Ignoring stale pattern bundle: %s", bundle_file)
+        return None
+
+    try:
+        with open(bundle_file, "rb") as f:
+            bundle = pickle.load(f)
+        files, patterns = bundle["files"], bundle["patterns"]
+    except Exception:
+        # Truncated, corrupt or written by an incompatible version
+        logger.warning("Ignoring unreadable pattern bundle: %s", bundle_file, exc_info=True)
+        return None
+
+    if files != [p.name for p in pattern_files]:
+        logger.info("Ignoring pattern bundle for a different file set: %s", bundle_file)
+        return None
+
+    logger.debug("Loaded patterns from bundle: %s", bundle_file)
+    return patterns
+
+
+def write_bundle(patterns_dir: Path | None = None) -> Path:
+    """Write all patterns in a directory to a single prebuilt bundle.
+
+    Run at image build time so the server starts with one unpickle instead
+    of parsing every YAML file.
+
+    Returns:
+        Path of the written bundle.
+    """
+    directory = patterns_dir or PATTERNS_DIR
+    pattern_files = _list_pattern_files(directory)
+    bundle = {
+        "files": [p.name for p in pattern_files],
+        "patterns": _parse_patterns(pattern_files),
+    }
+    bundle_file = directory / BUNDLE_FILE
+    with open(bundle_file, "wb") as f:
+        pickle.dump(bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+    logger.info("Wrote %d patterns to %s", len(bundle["patterns"]), bundle_file)
+    return bundle_file
+
 
 def load_patterns(patterns_dir: Path | None = None) -> dict[str, dict[str, Any]]:
     """Load all pattern definitions from YAML files.
@@ -35,18 +160,17 @@ def load_patterns(patterns_dir: Path | None = None) -> dict[str, dict[str, Any]]
         return _patterns_cache
 
     directory = patterns_dir or PATTERNS_DIR
-    patterns: dict[str, dict[str, Any]] = {}
 
     if not directory.exists():
         logger.warning("Patterns directory not found: %s", directory)
-        return patterns
-
-    for pattern_file in directory.glob("*.yaml"):
-        with open(pattern_file) as f:
-            pattern = yaml.safe_load(f)
-            if pattern and "name" in pattern:
-                patterns[pattern["name"]] = pattern
-                logger.debug("Loaded pattern: %s", pattern["name"])
+        return {}
+
+    pattern_files = _list_pattern_files(directory)
+    patterns = None
+    if USE_BUNDLE and patterns_dir is None:
+        patterns = _read_bundle(directory, pattern_files)
+    if patterns is None:
+        patterns = _parse_patterns(pattern_files)
 
     logger.info("Loaded %d patterns from %s", len(patterns), directory)
 
@@ -3,10 +3,13 @@
 Ported from scripts/resolve-pattern.py for use in the MCP server.
 """
 
+import functools
 import logging
 import re
 from typing import Any
 
+from .loader import load_patterns
+
 logger = logging.getLogger(__name__)
 
 # Default sizes by environment (no external sizing-defaults.yaml needed)
@@ -24,6 +27,13 @@ VALID_ENVIRONMENTS = ("prototype", "dev", "tst", "stg", "prd")
 
 VALID_TIERS = (1, 2, 3, 4)
 
+# Set view of VALID_ENVIRONMENTS for membership tests; the tuple keeps the
+# order used in error messages. Size and tier stay tuple scans since they
+# come from free-form config/metadata and may be unhashable.
+_VALID_ENVIRONMENTS = frozenset(VALID_ENVIRONMENTS)
+
+_REQUIRED_METADATA = ("project", "environment", "business_unit", "owners")
+
 # Validation pattern for state key path components
 _SAFE_PATH_COMPONENT = re.compile(r"^[a-zA-Z0-9_-]+$")
 
@@ -54,6 +64,16 @@ class PatternResolver:
 
     def __init__(self, patterns: dict[str, dict[str, Any]]):
         self.patterns = patterns
+        # Per-pattern required fields and flattened optional config, indexed
+        # once here instead of re-walked (and re-normalized) on every request
+        self._required: dict[str, tuple[str, ...]] = {}
+        self._optional: dict[str, dict[str, Any]] = {}
+        for name, pattern in patterns.items():
+            pattern_config = pattern.get("config") or {}
+            self._required[name] = tuple(pattern_config.get("required", []))
+            self._optional[name] = normalize_optional(pattern_config.get("optional", {}))
+        # Pattern list as shown in unknown-pattern errors, formatted once
+        self._available = str(list(patterns.keys()))
 
     def validate_config(
         self,
@@ -73,11 +93,11 @@ class PatternResolver:
         if pattern_name not in self.patterns:
             errors.append(
                 f"Unknown pattern: {pattern_name}. "
-                f"Available: {list(self.patterns.keys())}"
+                f"Available: {self._available}"
             )
             return {"valid": False, "errors": errors, "warnings": warnings}
 
-        if environment not in VALID_ENVIRONMENTS:
+        if environment not in _VALID_ENVIRONMENTS:
             errors.append(
                 f"Invalid environment: {environment}. Must be one of: {', '.join(VALID_ENVIRONMENTS)}"
             )
@@ -89,16 +109,14 @@ class PatternResolver:
                 f"Invalid size: {size}. Must be one of: {', '.join(VALID_SIZES)}"
             )
 
-        pattern = self.patterns[pattern_name]
-        required_config = pattern.get("config", {}).get("required", [])
-        for field in required_config:
+        for field in self._required[pattern_name]:
             if field not in config:
                 errors.append(f"Missing required config field: {field}")
 
         if metadata is None:
             errors.append("Metadata is required")
         else:
-            for field in ("project", "environment", "business_unit", "owners"):
+            for field in _REQUIRED_METADATA:
                 if field not in metadata:
                     errors.append(f"Missing required metadata field: {field}")
 
@@ -135,10 +153,41 @@ class PatternResolver:
         Returns:
             Dict of Terraform variable values ready for tfvars.json
         """
+        validation, tfvars = self.validate_and_resolve(
+            pattern_name, environment, config, metadata
+        )
+        if tfvars is None:
+            raise ValueError(f"Invalid config: {validation['errors']}")
+        return tfvars
+
+    def validate_and_resolve(
+        self,
+        pattern_name: str,
+        environment: str,
+        config: dict[str, Any],
+        metadata: dict[str, Any],
+    ) -> tuple[dict[str, Any], dict[str, Any] | None]:
+        """Validate a pattern request once and resolve it if valid.
+
+        For callers that report validation errors themselves instead of
+        catching the ValueError raised by resolve().
+
+        Returns:
+            (validation result as from validate_config, tfvars or None if invalid)
+        """
         validation = self.validate_config(pattern_name, environment, config, metadata)
         if not validation["valid"]:
-            raise ValueError(f"Invalid config: {validation['errors']}")
+            return validation, None
+        return validation, self._resolve(pattern_name, environment, config, metadata)
 
+    def _resolve(
+        self,
+        pattern_name: str,
+        environment: str,
+        config: dict[str, Any],
+        metadata: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Resolve an already-validated pattern request."""
         pattern = self.patterns[pattern_name]
         size = config.get("size", DEFAULT_SIZES.get(environment, "small"))
 
@@ -163,10 +212,7 @@ class PatternResolver:
         tfvars.update(sizing)
 
         # Apply optional config with defaults
-        optional_raw = pattern.get("config", {}).get("optional", {})
-        optional_config = normalize_optional(optional_raw)
-
-        for key, spec in optional_config.items():
+        for key, spec in self._optional[pattern_name].items():
             if key in config:
                 tfvars[key] = config[key]
             elif isinstance(spec, dict) and "default" in spec:
@@ -206,8 +252,22 @@ class PatternResolver:
     def _resolve_sizing(
         self, pattern: dict[str, Any], size: str, environment: str
     ) -> dict[str, Any]:
-        """Look up sizing values from pattern definition."""
+        """Look up sizing values from pattern definition.
+
+        The returned dict is shared with the pattern definition and must be
+        treated as read-only; _resolve() only merges it into tfvars.
+        """
         sizing = pattern.get("sizing", {})
         if size in sizing and environment in sizing[size]:
-            return sizing[size][environment].copy()
+            return sizing[size][environment]
         return {}
+
+
+@functools.cache
+def get_resolver() -> PatternResolver:
+    """Shared resolver over the default patterns directory, built on first call.
+
+    The server calls this at startup, once logging is configured, so the
+    patterns are loaded before the first tool call.
+    """
+    return PatternResolver(load_patterns())
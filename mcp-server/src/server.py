@@ -12,7 +12,7 @@ from typing import Any
 from mcp.server.fastmcp import FastMCP
 
 from .patterns.loader import load_patterns
-from .patterns.resolver import PatternResolver
+from .patterns.resolver import get_resolver
 from .tools import patterns as pattern_tools
 from .tools import provision as provision_tools
 from .tools import status as status_tools
@@ -25,6 +25,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Load patterns now that logging is configured, so load messages are kept
+# and pattern errors surface at startup rather than on the first tool call
+get_resolver()
+
 transport = os.environ.get("MCP_TRANSPORT", "streamable-http")
 host = os.environ.get("MCP_HOST", "127.0.0.1")
 port = int(os.environ.get("MCP_PORT", "8000"))
@@ -75,16 +79,9 @@ if _auth_provider:
     async def auth_callback(request):
         return await _auth_provider.handle_callback(request)
 
-# Shared resolver instance (patterns are cached after first load)
-_resolver: PatternResolver | None = None
-
-
-def _get_resolver() -> PatternResolver:
-    """Get or create the shared PatternResolver instance."""
-    global _resolver
-    if _resolver is None:
-        _resolver = PatternResolver(load_patterns())
-    return _resolver
+def _to_json(result: Any) -> str:
+    """Serialize a tool result as compact JSON (no indentation or padding)."""
+    return json.dumps(result, separators=(",", ":"))
 
 
 # --- Pattern Discovery Tools ---
@@ -98,7 +95,7 @@ def list_patterns(category: str | None = None) -> str:
         category: Optional filter - "single-resource" or "composite"
     """
     results = pattern_tools.list_patterns(category)
-    return json.dumps(results, indent=2)
+    return _to_json(results)
 
 
 @mcp.tool()
@@ -109,7 +106,7 @@ def get_pattern_details(pattern_name: str) -> str:
         pattern_name: Pattern name (key_vault, postgresql, container_app, container_registry, web_backend)
     """
     details = pattern_tools.get_pattern_details(pattern_name)
-    return json.dumps(details, indent=2)
+    return _to_json(details)
 
 
 @mcp.tool()
@@ -139,7 +136,7 @@ def validate_config(
         size: T-shirt size override (small, medium, large, xlarge)
         tier: Application tier (1-4, default 4)
     """
-    resolver = _get_resolver()
+    resolver = get_resolver()
 
     config: dict[str, Any] = {"name": name}
     if size:
@@ -155,14 +152,15 @@ def validate_config(
         "tier": tier,
     }
 
-    validation = resolver.validate_config(pattern_name, environment, config, metadata)
+    validation, tfvars = resolver.validate_and_resolve(
+        pattern_name, environment, config, metadata
+    )
 
     # Also show what would be resolved
-    if validation["valid"]:
-        tfvars = resolver.resolve(pattern_name, environment, config, metadata)
+    if tfvars is not None:
         validation["resolved_tfvars"] = tfvars
 
-    return json.dumps(validation, indent=2)
+    return _to_json(validation)
 
 
 # --- Provisioning Tools (Prototype Mode) ---
@@ -210,7 +208,7 @@ async def provision(
         application_name=application_name,
         tier=tier,
     )
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool()
@@ -252,7 +250,7 @@ async def destroy(
         application_name=application_name,
         tier=tier,
     )
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 # --- Production Mode (GitOps) ---
@@ -306,7 +304,7 @@ async def push_tfvars(
         application_name=application_name,
         tier=tier,
     )
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 # --- Status Tools ---
@@ -320,7 +318,7 @@ async def check_status(run_id: int) -> str:
         run_id: GitHub Actions workflow run ID
     """
     result = await status_tools.check_status(run_id)
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool()
@@ -334,7 +332,7 @@ async def list_deployments(
         limit: Max results (default 10, max 100)
     """
     results = await status_tools.list_deployments(status=status, limit=limit)
-    return json.dumps(results, indent=2)
+    return _to_json(results)
 
 
 def main():
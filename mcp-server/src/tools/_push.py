@@ -6,14 +6,12 @@ from datetime import datetime, timezone
 from typing import Any
 
 from ..github.client import GitHubClient
-from ..patterns.loader import load_patterns
-from ..patterns.resolver import PatternResolver
+from ..patterns.resolver import get_resolver
 
 logger = logging.getLogger(__name__)
 
 # Module-level singletons for connection reuse
 _github_client: GitHubClient | None = None
-_resolver: PatternResolver | None = None
 
 
 def _get_github_client() -> GitHubClient:
@@ -23,13 +21,6 @@ def _get_github_client() -> GitHubClient:
     return _github_client
 
 
-def _get_resolver() -> PatternResolver:
-    global _resolver
-    if _resolver is None:
-        _resolver = PatternResolver(load_patterns())
-    return _resolver
-
-
 async def push_pattern(
     pattern_name: str,
     environment: str,
@@ -49,14 +40,15 @@ async def push_pattern(
     Returns:
         Dict with push status, folder path, state key, and commit info
     """
-    resolver = _get_resolver()
+    resolver = get_resolver()
 
     # Validate and resolve
-    validation = resolver.validate_config(pattern_name, environment, config, metadata)
-    if not validation["valid"]:
+    validation, tfvars = resolver.validate_and_resolve(
+        pattern_name, environment, config, metadata
+    )
+    if tfvars is None:
         return {"error": "Validation failed", "details": validation["errors"]}
 
-    tfvars = resolver.resolve(pattern_name, environment, config, metadata)
     state_key = resolver.compute_state_key(
         pattern_name, environment, config, metadata
     )
@@ -10,8 +10,7 @@ import logging
 from typing import Any
 
 from ..github.client import GitHubClient
-from ..patterns.loader import load_patterns
-from ..patterns.resolver import PatternResolver
+from ..patterns.resolver import get_resolver
 from ._push import push_pattern
 
 logger = logging.getLogger(__name__)
@@ -29,10 +28,6 @@ def _get_github_client() -> GitHubClient:
     return _github_client
 
 
-def _get_resolver() -> PatternResolver:
-    return PatternResolver(load_patterns())
-
-
 async def provision(
     pattern_name: str,
     config: dict[str, Any],
@@ -93,7 +88,7 @@ async def destroy(
     workflow_dispatch with base64-encoded tfvars.
     """
     environment = "prototype"
-    resolver = _get_resolver()
+    resolver = get_resolver()
 
     metadata = {
         "project": project,
@@ -108,14 +103,13 @@ async def destroy(
 
     resolved_config = dict(config)
 
-    # Validate
-    validation = resolver.validate_config(
+    # Validate and resolve
+    validation, tfvars = resolver.validate_and_resolve(
         pattern_name, environment, resolved_config, metadata
     )
-    if not validation["valid"]:
+    if tfvars is None:
         return {"error": "Validation failed", "details": validation["errors"]}
 
-    tfvars = resolver.resolve(pattern_name, environment, resolved_config, metadata)
     tfvars_json = json.dumps(tfvars)
     tfvars_b64 = base64.b64encode(tfvars_json.encode()).decode()
 
@@ -16,11 +16,17 @@ Usage:
 """
 
 import argparse
+import atexit
 import json
+import mmap
 import os
+import pickle
+import re
 import sys
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import yaml
 
@@ -30,31 +36,266 @@ REPO_ROOT = Path(__file__).parent.parent
 PATTERNS_DIR = REPO_ROOT / "config" / "patterns"
 SIZING_DEFAULTS = REPO_ROOT / "config" / "sizing-defaults.yaml"
 
+# Parsed metadata cache for the most recently used patterns directory,
+# reused across invocations while the YAML is unchanged
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+METADATA_CACHE = CACHE_DIR / "resolve-pattern" / "metadata.pkl"
+
+# Request files at least this large are memory-mapped instead of read
+MMAP_MIN_BYTES = 256 * 1024
+
+# Accepted request actions and environments; callers check isinstance(str)
+# first, since YAML can hand back unhashable lists or mappings here
+_VALID_ACTIONS = frozenset(("create", "destroy"))
+_VALID_ENVIRONMENTS = frozenset(("prototype", "dev", "tst", "stg", "prd"))
+
+# Metadata every request must carry
+REQUIRED_METADATA_FIELDS = ("project", "environment", "business_unit", "owners")
+_REQUIRED_META = frozenset(REQUIRED_METADATA_FIELDS)
+
+# Below this many documents, parsing a request stream in worker processes
+# is slower than load_all. Measured: ~55-120 us to parse a document, ~5 us
+# per document of pickling/IPC in the parent and 10-20 ms of pool start-up,
+# which breaks even around 400-650 documents on 2-4 cores.
+PARALLEL_PARSE_MIN_DOCUMENTS = 1024
+
+# Column-0 document start markers, and the constructs that make splitting
+# a stream on them unsafe (directives, document end markers)
+_YAML_DOCUMENT_START = re.compile(rb"^---(?=[ \t\r\n]|$)", re.MULTILINE)
+_YAML_DIRECTIVE_OR_END = re.compile(rb"^(?:%|\.\.\.(?=[ \t\r\n]|$))", re.MULTILINE)
+
+# Prefer the libyaml-backed loader; fall back to pure Python if unavailable
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Marks an optional config key whose spec has no default value
+_NO_DEFAULT = object()
+
+
+def _read_metadata_cache(scope: str) -> Dict[str, tuple]:
+    """Return the cached parse results for scope, or an empty cache if none is usable."""
+    try:
+        with open(METADATA_CACHE, "rb") as f:
+            cached = pickle.load(f)
+    except Exception:
+        # Missing, unreadable or written by an incompatible version
+        return {}
+    if not isinstance(cached, dict) or cached.get("scope") != scope:
+        # Built for another patterns directory (or an older layout)
+        return {}
+    entries = cached.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def _write_metadata_cache(scope: str, entries: Dict[str, tuple]) -> None:
+    """Atomically replace the metadata cache; failures are not fatal."""
+    tmp = METADATA_CACHE.with_name(f"{METADATA_CACHE.name}.{os.getpid()}.tmp")
+    try:
+        METADATA_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "wb") as f:
+            pickle.dump({"scope": scope, "entries": entries}, f, protocol=5)
+        os.replace(tmp, METADATA_CACHE)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+# In-memory copy of METADATA_CACHE: resolved path -> ((mtime_ns, size), data),
+# for the patterns directory named by _yaml_cache_scope. Changes are written
+# back once, by _flush_metadata_cache() at exit.
+_yaml_cache: Optional[Dict[str, tuple]] = None
+_yaml_cache_scope: Optional[str] = None
+_yaml_cache_dirty = False
+
+
+def _use_metadata_cache(patterns_dir: Path) -> None:
+    """Make _load_yaml use the metadata cache for patterns_dir."""
+    global _yaml_cache, _yaml_cache_scope, _yaml_cache_dirty
+    scope = str(patterns_dir.resolve())
+    if scope == _yaml_cache_scope:
+        return
+
+    _flush_metadata_cache()
+    cached = _read_metadata_cache(scope)
+    # Drop entries for files that have since been deleted
+    _yaml_cache = {key: entry for key, entry in cached.items() if os.path.exists(key)}
+    _yaml_cache_scope = scope
+    _yaml_cache_dirty = len(_yaml_cache) != len(cached)
+
+
+@atexit.register
+def _flush_metadata_cache() -> None:
+    """Write the metadata cache back if anything changed since it was read."""
+    global _yaml_cache_dirty
+    if _yaml_cache_dirty:
+        _write_metadata_cache(_yaml_cache_scope, _yaml_cache)
+        _yaml_cache_dirty = False
+
+
+def _load_yaml(path: Path, use_cache: bool = True) -> Any:
+    """Parse a YAML file, reusing the metadata cache while the file is unchanged."""
+    if not use_cache or _yaml_cache is None:
+        with open(path) as f:
+            return yaml.load(f, Loader=_YAML_LOADER)
+
+    global _yaml_cache_dirty
+    st = path.stat()
+    key = str(path.resolve())
+    stamp = (st.st_mtime_ns, st.st_size)
+    entry = _yaml_cache.get(key)
+    if entry is not None and entry[0] == stamp:
+        return entry[1]
+
+    with open(path) as f:
+        data = yaml.load(f, Loader=_YAML_LOADER)
+    _yaml_cache[key] = (stamp, data)
+    _yaml_cache_dirty = True
+    return data
+
+
+def _normalize_optional(optional_raw: List[Any]) -> Dict[str, Any]:
+    """Flatten a list of single-key dicts into one dict."""
+    return {
+        key: spec
+        for item in optional_raw if isinstance(item, dict)
+        for key, spec in item.items()
+    }
+
+
+class _LazyPatterns(Mapping):
+    """
+    Pattern definitions keyed by name, parsed on first access.
+
+    Pattern files are indexed by file name (key_vault.yaml -> key_vault), so
+    a single-request run only parses the one pattern it references. When a
+    lookup misses that index, e.g. aks-cluster.yaml declares
+    ``name: aks_cluster``, every file is parsed and indexed by its ``name``
+    field instead, which is also what iteration uses.
+    """
+
+    __slots__ = ("_files", "_use_cache", "_loaded", "_complete")
+
+    def __init__(self, files: Dict[str, Path], use_cache: bool = True):
+        self._files = files
+        self._use_cache = use_cache
+        self._loaded: Dict[str, Dict] = {}
+        self._complete = False
+
+    def _parse(self, path: Path) -> Optional[Dict]:
+        """Parse one pattern file, or None if it does not define a pattern."""
+        pattern = _load_yaml(path, self._use_cache)
+        if not isinstance(pattern, dict) or "name" not in pattern:
+            return None
+
+        # Optional config may be written as a list of single-key dicts;
+        # flatten it once here rather than on every resolve
+        config = pattern.get("config")
+        if isinstance(config, dict) and isinstance(config.get("optional"), list):
+            config["optional"] = _normalize_optional(config["optional"])
+        return pattern
+
+    def _load_all(self) -> None:
+        """Parse every pattern file and index it by its declared name."""
+        loaded: Dict[str, Dict] = {}
+        for path in self._files.values():
+            pattern = self._parse(path)
+            if pattern is not None:
+                loaded[pattern["name"]] = pattern
+        self._loaded = loaded
+        self._complete = True
+
+    def __getitem__(self, name: str) -> Dict:
+        try:
+            return self._loaded[name]
+        except KeyError:
+            if self._complete:
+                raise
+
+        path = self._files.get(name)
+        if path is not None:
+            pattern = self._parse(path)
+            if pattern is not None and pattern["name"] == name:
+                self._loaded[name] = pattern
+                return pattern
+
+        # No file named after this pattern: fall back to declared names.
+        # Unknown names raise KeyError here, which also drives `in`
+        self._load_all()
+        return self._loaded[name]
+
+    def __iter__(self):
+        if not self._complete:
+            self._load_all()
+        return iter(list(self._loaded))
+
+    def __len__(self) -> int:
+        if not self._complete:
+            self._load_all()
+        return len(self._loaded)
+
 
 class PatternResolver:
     """Resolves pattern requests to Terraform variables."""
 
-    def __init__(self, patterns_dir: Path = PATTERNS_DIR, sizing_file: Path = SIZING_DEFAULTS):
+    __slots__ = (
+        "patterns_dir",
+        "sizing_file",
+        "use_cache",
+        "patterns",
+        "sizing_defaults",
+        "_summaries",
+        "_available",
+        "_env_defaults",
+        "_common_skus",
+        "_conditionals",
+        "_optional_plans",
+    )
+
+    def __init__(
+        self,
+        patterns_dir: Path = PATTERNS_DIR,
+        sizing_file: Path = SIZING_DEFAULTS,
+        use_cache: bool = True,
+    ):
         self.patterns_dir = patterns_dir
         self.sizing_file = sizing_file
-        self.patterns: Dict[str, Dict] = {}
+        self.use_cache = use_cache
+        self.patterns: Mapping[str, Dict] = {}
         self.sizing_defaults: Dict[str, Any] = {}
+        self._summaries: Optional[Dict[str, Dict]] = None
+        self._available: Optional[str] = None
+        self._optional_plans: Dict[str, tuple] = {}
         self._load_metadata()
 
     def _load_metadata(self):
-        """Load all pattern metadata and sizing defaults."""
+        """Load sizing defaults and index pattern definitions for lazy parsing."""
+        if self.use_cache:
+            _use_metadata_cache(self.patterns_dir)
+
         # Load sizing defaults
         if self.sizing_file.exists():
-            with open(self.sizing_file) as f:
-                self.sizing_defaults = yaml.safe_load(f)
+            self.sizing_defaults = _load_yaml(self.sizing_file, self.use_cache)
+        self._index_sizing_defaults()
 
-        # Load pattern definitions
+        # Index pattern definitions; each is parsed on first lookup
+        files: Dict[str, Path] = {}
         if self.patterns_dir.exists():
-            for pattern_file in self.patterns_dir.glob("*.yaml"):
-                with open(pattern_file) as f:
-                    pattern = yaml.safe_load(f)
-                    if pattern and "name" in pattern:
-                        self.patterns[pattern["name"]] = pattern
+            files = {path.stem: path for path in self.patterns_dir.glob("*.yaml")}
+        self.patterns = _LazyPatterns(files, self.use_cache)
+
+    def _index_sizing_defaults(self):
+        """Hoist the sizing-defaults sections used on every resolve."""
+        self._env_defaults = self.sizing_defaults.get("environment_defaults", {})
+        self._common_skus = self.sizing_defaults.get("common_skus", {})
+        # (feature, {env: value}) pairs, iterated as-is by _apply_conditionals
+        self._conditionals = tuple(
+            self.sizing_defaults.get("conditional_features", {}).items()
+        )
+
+    @property
+    def _available_patterns(self) -> str:
+        """Formatted names of all loadable patterns, for unknown-pattern errors."""
+        if self._available is None:
+            self._available = str(list(self.patterns.keys()))
+        return self._available
 
     def validate_request(self, request: Dict) -> Dict[str, Any]:
         """
@@ -68,7 +309,7 @@ class PatternResolver:
 
         # Validate action field (optional, defaults to "create")
         action = request.get("action", "create")
-        if action not in ["create", "destroy"]:
+        if not (isinstance(action, str) and action in _VALID_ACTIONS):
             errors.append(f"Invalid action: {action}. Must be 'create' or 'destroy'")
 
         # Check required fields
@@ -78,28 +319,42 @@ class PatternResolver:
             errors.append("Missing required field: metadata")
         else:
             meta = request.get("metadata", {})
-            for field in ["project", "environment", "business_unit", "owners"]:
-                if field not in meta:
-                    errors.append(f"Missing required metadata field: {field}")
+            missing = _REQUIRED_META - meta.keys()
+            if missing:
+                # Report in declaration order, not set order
+                errors.extend(
+                    f"Missing required metadata field: {field}"
+                    for field in REQUIRED_METADATA_FIELDS if field in missing
+                )
 
             # Validate environment
             env = meta.get("environment", "")
-            if env not in ["prototype", "dev", "tst", "stg", "prd"]:
+            if not (isinstance(env, str) and env in _VALID_ENVIRONMENTS):
                 errors.append(f"Invalid environment: {env}. Must be prototype, dev, tst, stg, or prd")
 
         # Validate pattern exists
+        patterns = self.patterns
         pattern_name = request.get("pattern", "")
-        if pattern_name and pattern_name not in self.patterns:
-            errors.append(f"Unknown pattern: {pattern_name}. Available: {list(self.patterns.keys())}")
+        pattern = patterns.get(pattern_name) if pattern_name else None
+        if pattern_name and pattern is None:
+            errors.append(f"Unknown pattern: {pattern_name}. Available: {self._available_patterns}")
 
         # Validate config
         config = request.get("config", {})
-        if pattern_name in self.patterns:
-            pattern = self.patterns[pattern_name]
+        if pattern is not None:
             required_config = pattern.get("config", {}).get("required", [])
-            for field in required_config:
-                if field not in config:
-                    errors.append(f"Missing required config field: {field}")
+            if isinstance(config, dict):
+                missing = frozenset(required_config) - config.keys()
+                errors.extend(
+                    f"Missing required config field: {field}"
+                    for field in required_config if field in missing
+                )
+            else:
+                # Non-mapping config (e.g. a YAML list): plain membership test
+                errors.extend(
+                    f"Missing required config field: {field}"
+                    for field in required_config if field not in config
+                )
 
         return {
             "valid": len(errors) == 0,
@@ -122,6 +377,10 @@ class PatternResolver:
         if not validation["valid"]:
             raise ValueError(f"Invalid request: {validation['errors']}")
 
+        return self._resolve_unchecked(request)
+
+    def _resolve_unchecked(self, request: Dict) -> Dict[str, Any]:
+        """Resolve a request the caller has already validated."""
         pattern_name = request["pattern"]
         pattern = self.patterns[pattern_name]
         metadata = request["metadata"]
@@ -153,44 +412,53 @@ class PatternResolver:
         # Add sizing-resolved values
         tfvars.update(sizing)
 
-        # Add pattern-specific config values
-        # Handle both list format (from YAML files) and dict format
-        optional_raw = pattern.get("config", {}).get("optional", {})
-        if isinstance(optional_raw, list):
-            # Convert list of single-key dicts to a flat dict
-            optional_config = {}
-            for item in optional_raw:
-                if isinstance(item, dict):
-                    optional_config.update(item)
-        else:
-            optional_config = optional_raw
-
-        for key, spec in optional_config.items():
+        # Add pattern-specific config values, in the pattern's declared order
+        for key, default in self._optional_plan(pattern_name, pattern):
             if key in config:
                 tfvars[key] = config[key]
-            elif isinstance(spec, dict) and "default" in spec:
-                tfvars[key] = spec["default"]
+            elif default is not _NO_DEFAULT:
+                tfvars[key] = default
 
         # Apply conditional features
         tfvars = self._apply_conditionals(tfvars, environment)
 
         return tfvars
 
+    def _optional_plan(self, pattern_name: str, pattern: Dict) -> tuple:
+        """(key, default or _NO_DEFAULT) pairs for a pattern's optional config."""
+        try:
+            return self._optional_plans[pattern_name]
+        except KeyError:
+            pass
+
+        # Normalized to a dict at load, so this is a single pass per pattern
+        optional_config = pattern.get("config", {}).get("optional", {})
+        plan = tuple(
+            (key, spec["default"] if isinstance(spec, dict) and "default" in spec else _NO_DEFAULT)
+            for key, spec in optional_config.items()
+        )
+        self._optional_plans[pattern_name] = plan
+        return plan
+
     def _get_default_size(self, environment: str) -> str:
         """Get default t-shirt size for environment."""
-        defaults = self.sizing_defaults.get("environment_defaults", {})
-        return defaults.get(environment, "small")
+        return self._env_defaults.get(environment, "small")
 
     def _resolve_sizing(self, pattern: Dict, size: str, environment: str) -> Dict[str, Any]:
-        """Resolve sizing values from pattern metadata."""
+        """
+        Resolve sizing values from pattern metadata.
+
+        The returned dict may be shared with the pattern definition and must
+        be treated as read-only; resolve() only merges it into tfvars.
+        """
         sizing = pattern.get("sizing", {})
 
         # Get values for this size and environment
         if size in sizing and environment in sizing[size]:
-            return sizing[size][environment].copy()
+            return sizing[size][environment]
 
         # Fallback to common SKUs from sizing defaults
-        common = self.sizing_defaults.get("common_skus", {})
+        common = self._common_skus
         result = {}
 
         # Map pattern name to common SKU type
@@ -206,25 +474,26 @@ class PatternResolver:
 
     def _apply_conditionals(self, tfvars: Dict[str, Any], environment: str) -> Dict[str, Any]:
         """Apply conditional features based on environment."""
-        conditionals = self.sizing_defaults.get("conditional_features", {})
-
-        for feature, env_values in conditionals.items():
+        for feature, env_values in self._conditionals:
             # Only apply if not already set
             if feature not in tfvars:
                 tfvars[feature] = env_values.get(environment, False)
 
         return tfvars
 
+    @property
     def list_patterns(self) -> Dict[str, Dict]:
-        """List all available patterns."""
-        result = {}
-        for name, pattern in self.patterns.items():
-            result[name] = {
-                "description": pattern.get("description", "").split("\n")[0],
-                "category": pattern.get("category", "unknown"),
-                "components": pattern.get("components", []),
-            }
-        return result
+        """Summaries of all available patterns (computed once per resolver)."""
+        if self._summaries is None:
+            result = {}
+            for name, pattern in self.patterns.items():
+                result[name] = {
+                    "description": pattern.get("description", "").split("\n")[0],
+                    "category": pattern.get("category", "unknown"),
+                    "components": pattern.get("components", []),
+                }
+            self._summaries = result
+        return self._summaries
 
     def _compute_state_key(self, request: Dict) -> str:
         """Compute the Terraform state key for a pattern request."""
@@ -249,52 +518,54 @@ class PatternResolver:
         Returns:
             List of results with index, action, pattern, tfvars, and state_key
         """
-        results = []
-        for i, doc in enumerate(documents):
-            if doc is None:
-                continue
-
-            action = doc.get("action", "create")
-            pattern_name = doc.get("pattern", "unknown")
-
-            # Validate the document
-            validation = self.validate_request(doc)
-            if not validation["valid"]:
-                results.append({
-                    "index": i,
-                    "action": action,
-                    "pattern": pattern_name,
-                    "valid": False,
-                    "errors": validation["errors"],
-                    "tfvars": None,
-                    "state_key": None
-                })
-                continue
-
-            # Resolve the pattern
-            try:
-                tfvars = self.resolve(doc)
-                results.append({
-                    "index": i,
-                    "action": action,
-                    "pattern": pattern_name,
-                    "valid": True,
-                    "errors": [],
-                    "tfvars": tfvars,
-                    "state_key": self._compute_state_key(doc)
-                })
-            except ValueError as e:
-                results.append({
-                    "index": i,
-                    "action": action,
-                    "pattern": pattern_name,
-                    "valid": False,
-                    "errors": [str(e)],
-                    "tfvars": None,
-                    "state_key": None
-                })
+        # Resolved serially: pickling a document and its result for a worker
+        # process costs more than resolving it
+        return [
+            self._resolve_document(i, doc)
+            for i, doc in enumerate(documents) if doc is not None
+        ]
+
+    def _resolve_document(self, index: int, doc: Dict) -> Dict[str, Any]:
+        """Validate and resolve a single document of a multi-document YAML."""
+        action = doc.get("action", "create")
+        pattern_name = doc.get("pattern", "unknown")
+
+        # Validate the document
+        validation = self.validate_request(doc)
+        if not validation["valid"]:
+            return {
+                "index": index,
+                "action": action,
+                "pattern": pattern_name,
+                "valid": False,
+                "errors": validation["errors"],
+                "tfvars": None,
+                "state_key": None
+            }
 
-        return results
+        # Resolve the pattern
+        try:
+            # Already validated above
+            tfvars = self._resolve_unchecked(doc)
+            return {
+                "index": index,
+                "action": action,
+                "pattern": pattern_name,
+                "valid": True,
+                "errors": [],
+                "tfvars": tfvars,
+                "state_key": self._compute_state_key(doc)
+            }
+        except ValueError as e:
+            return {
+                "index": index,
+                "action": action,
+                "pattern": pattern_name,
+                "valid": False,
+                "errors": [str(e)],
+                "tfvars": None,
+                "state_key": None
+            }
 
     def compute_execution_order(self, results: List[Dict[str, Any]]) -> List[int]:
         """
@@ -308,53 +579,115 @@ class PatternResolver:
         Returns:
             List of indices in execution order
         """
-        destroy_indices = []
-        create_indices = []
-
-        for result in results:
-            if not result.get("valid", False):
-                continue
-            if result.get("action") == "destroy":
-                destroy_indices.append(result["index"])
-            else:
-                create_indices.append(result["index"])
+        # Results come from resolve_all, which always sets valid/action/index
+        valid = [r for r in results if r["valid"]]
+        destroy_indices = [r["index"] for r in valid if r["action"] == "destroy"]
+        create_indices = [r["index"] for r in valid if r["action"] != "destroy"]
 
         # Destroy first, then create
         return destroy_indices + create_indices
 
 
+def _split_documents(buf: Union[bytes, mmap.mmap]) -> List[bytes]:
+    """
+    Split a YAML stream into one chunk per document.
+
+    Chunks start at column-0 ``---`` markers (YAML 1.2.2 section 9.1.2). Streams
+    with directives or ``...`` end markers are returned whole, since they
+    cannot be cut on start markers alone.
+    """
+    if _YAML_DIRECTIVE_OR_END.search(buf):
+        return [buf]
+    starts = [m.start() for m in _YAML_DOCUMENT_START.finditer(buf)]
+    if not starts or starts[0] != 0:
+        starts.insert(0, 0)
+    return [buf[start:end] for start, end in zip(starts, starts[1:] + [len(buf)])]
+
+
+def _parse_document(chunk: bytes) -> Any:
+    """Parse a single YAML document (process pool entry point)."""
+    return yaml.load(chunk, Loader=_YAML_LOADER)
+
+
+def load_documents(buf: Union[bytes, mmap.mmap]) -> List[Any]:
+    """
+    Parse every document of a multi-document YAML stream.
+
+    Large streams are split on document markers and parsed across worker
+    processes. If any chunk fails to parse on its own, the whole stream is
+    re-parsed serially so errors and edge cases behave exactly as load_all.
+    """
+    # With a single CPU the pool adds start-up cost but no parallelism
+    chunks = _split_documents(buf) if (os.cpu_count() or 1) > 1 else []
+    if len(chunks) >= PARALLEL_PARSE_MIN_DOCUMENTS:
+        workers = min(os.cpu_count() or 1, len(chunks))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(
+                    _parse_document, chunks, chunksize=max(1, len(chunks) // (workers * 4))
+                ))
+        except yaml.YAMLError:
+            pass
+    return list(yaml.load_all(buf, Loader=_YAML_LOADER))
+
+
+def read_request_file(path: Path) -> List[Any]:
+    """Parse a request file as raw bytes; large files are memory-mapped."""
+    if path.stat().st_size >= MMAP_MIN_BYTES:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return load_documents(mm)
+    return load_documents(path.read_bytes())
+
+
+def _write_json(obj: Any) -> None:
+    """Stream 2-space indented JSON to stdout without building a str first."""
+    json.dump(obj, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+def _tfvars_list(value: List[Any]) -> str:
+    items = ", ".join(f'"{v}"' if isinstance(v, str) else str(v) for v in value)
+    return f"[{items}]"
+
+
+def _bool_literal(value: bool) -> str:
+    return "true" if value else "false"
+
+
+# Value formatters keyed by exact type; YAML only produces these builtins
+_TFVARS_FORMATTERS: Dict[type, Callable[[Any], str]] = {
+    bool: _bool_literal,
+    str: lambda v: f'"{v}"',
+    int: str,
+    float: str,
+    list: _tfvars_list,
+    dict: json.dumps,
+}
+
+_ENV_FORMATTERS: Dict[type, Callable[[Any], str]] = {
+    bool: _bool_literal,
+    list: json.dumps,
+    dict: json.dumps,
+}
+
+
 def output_tfvars(tfvars: Dict[str, Any]) -> str:
     """Output Terraform tfvars format."""
-    lines = []
-    for key, value in sorted(tfvars.items()):
-        if isinstance(value, bool):
-            lines.append(f'{key} = {str(value).lower()}')
-        elif isinstance(value, str):
-            lines.append(f'{key} = "{value}"')
-        elif isinstance(value, (int, float)):
-            lines.append(f'{key} = {value}')
-        elif isinstance(value, list):
-            items = ", ".join(f'"{v}"' if isinstance(v, str) else str(v) for v in value)
-            lines.append(f'{key} = [{items}]')
-        elif isinstance(value, dict):
-            lines.append(f'{key} = {json.dumps(value)}')
-        else:
-            lines.append(f'{key} = {json.dumps(value)}')
-    return "\n".join(lines)
+    formatters = _TFVARS_FORMATTERS
+    # Sort on keys only; values are never compared
+    return "\n".join(
+        f"{key} = {formatters.get(type(value), json.dumps)(value)}"
+        for key, value in sorted(tfvars.items(), key=lambda item: item[0])
+    )
 
 
 def output_env(tfvars: Dict[str, Any]) -> str:
     """Output environment variable format (for CI/CD)."""
-    lines = []
-    for key, value in sorted(tfvars.items()):
-        env_key = f"TF_VAR_{key}"
-        if isinstance(value, (list, dict)):
-            lines.append(f'{env_key}={json.dumps(value)}')
-        elif isinstance(value, bool):
-            lines.append(f'{env_key}={str(value).lower()}')
-        else:
-            lines.append(f'{env_key}={value}')
-    return "\n".join(lines)
+    formatters = _ENV_FORMATTERS
+    return "\n".join(
+        f"TF_VAR_{key}={formatters.get(type(value), str)(value)}"
+        for key, value in sorted(tfvars.items(), key=lambda item: item[0])
+    )
 
 
 def main():
@@ -394,17 +727,23 @@ def main():
         default=SIZING_DEFAULTS,
         help="Path to sizing defaults file"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Parse pattern YAML from scratch instead of using the metadata cache"
+    )
 
     args = parser.parse_args()
 
     resolver = PatternResolver(
         patterns_dir=args.patterns_dir,
-        sizing_file=args.sizing_file
+        sizing_file=args.sizing_file,
+        use_cache=not args.no_cache
     )
 
     # List patterns mode
     if args.list_patterns:
-        patterns = resolver.list_patterns()
+        patterns = resolver.list_patterns
         if args.output == "json":
             print(json.dumps(patterns, indent=2))
         else:
@@ -420,9 +759,8 @@ def main():
         print(f"Error: File not found: {args.request_file}", file=sys.stderr)
         return 1
 
-    with open(args.request_file) as f:
-        # Use safe_load_all for multi-document YAML support
-        documents = list(yaml.safe_load_all(f))
+    # Multi-document YAML support; raw bytes go straight to the loader
+    documents = read_request_file(args.request_file)
 
     # Filter out None documents (empty documents in multi-doc YAML)
     documents = [doc for doc in documents if doc is not None]
@@ -439,28 +777,40 @@ def main():
         results = resolver.resolve_all(documents)
         execution_order = resolver.compute_execution_order(results)
 
-        # Check for any validation errors
-        all_valid = all(r.get("valid", False) for r in results)
-
-        if args.validate:
-            validation_results = []
-            for r in results:
+        # Summarize in a single pass: validity, per-action counts, and
+        # the per-document validation view when requested
+        create_count = destroy_count = 0
+        invalid_docs = []
+        validation_results = []
+        for r in results:
+            valid = r["valid"]
+            action = r["action"]
+            if not valid:
+                invalid_docs.append(r)
+            elif action == "create":
+                create_count += 1
+            elif action == "destroy":
+                destroy_count += 1
+            if args.validate:
                 validation_results.append({
                     "index": r["index"],
-                    "action": r["action"],
+                    "action": action,
                     "pattern": r["pattern"],
-                    "valid": r["valid"],
-                    "errors": r.get("errors", [])
+                    "valid": valid,
+                    "errors": r["errors"]
                 })
+        all_valid = not invalid_docs
+
+        if args.validate:
             output = {
                 "document_count": len(documents),
                 "all_valid": all_valid,
                 "validations": validation_results,
                 "execution_order": execution_order,
-                "create_count": sum(1 for r in results if r.get("valid") and r.get("action") == "create"),
-                "destroy_count": sum(1 for r in results if r.get("valid") and r.get("action") == "destroy")
+                "create_count": create_count,
+                "destroy_count": destroy_count
             }
-            print(json.dumps(output, indent=2))
+            _write_json(output)
             return 0 if all_valid else 1
 
         # Multi-json output for provisioning workflow
@@ -469,17 +819,16 @@ def main():
             "all_valid": all_valid,
             "execution_order": execution_order,
             "patterns": results,
-            "create_count": sum(1 for r in results if r.get("valid") and r.get("action") == "create"),
-            "destroy_count": sum(1 for r in results if r.get("valid") and r.get("action") == "destroy")
+            "create_count": create_count,
+            "destroy_count": destroy_count
         }
 
-        if not all_valid:
-            invalid_docs = [r for r in results if not r.get("valid")]
+        if invalid_docs:
             print(f"Error: {len(invalid_docs)} document(s) failed validation", file=sys.stderr)
             for r in invalid_docs:
                 print(f"  Document {r['index']}: {r['errors']}", file=sys.stderr)
 
-        print(json.dumps(output, indent=2))
+        _write_json(output)
         return 0 if all_valid else 1
 
     # Single document mode (backward compatible)